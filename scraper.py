@@ -1,12 +1,36 @@
 #!/usr/bin/env python3
+import atexit
+import hashlib
 import json
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, date
-from typing import List, Dict
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, List, Dict, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - lxml is optional
+    HTML_PARSER = "html.parser"
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
 IMFS_URL = "https://www.imfs-frankfurt.de/veranstaltungen/alle-kommenden-veranstaltungen"
 LAWFIN_URL = "https://www.lawfin.uni-frankfurt.de/events/lawfin-research-seminars"
@@ -96,6 +120,9 @@ MONTH_MAP = {
     "dez": 12,
     "december": 12,
 }
+# Abbreviations are usually written with a trailing dot ("Nov."); include
+# those spellings so parse_date can look up the matched token directly.
+MONTH_MAP.update({k + ".": v for k, v in list(MONTH_MAP.items())})
 
 WEEKDAY_PREFIXES = [
     "montag",
@@ -126,15 +153,73 @@ WEEKDAY_PREFIXES = [
     "fri.",
     "sat.",
     "sun.",
+    "mon",
+    "tue",
+    "wed",
+    "thu",
+    "fri",
+    "sat",
+    "sun",
 ]
 
-WEEKDAY_PREFIX_RE = re.compile(
-    r"^(?:" + "|".join(WEEKDAY_PREFIXES) + r")\s*,?\s*",
-    re.IGNORECASE,
-)
+# Longest first so "mittwoch" is tried before "mi."
+_SORTED_WEEKDAY_PREFIXES = tuple(sorted(WEEKDAY_PREFIXES, key=len, reverse=True))
+_MAX_WEEKDAY_PREFIX = len(_SORTED_WEEKDAY_PREFIXES[0])
+
+# The pages are large, but only one container on each is ever read
+WIWI_STRAINER = SoupStrainer("table", class_="data-table-event")
+WIWI_DETAIL_STRAINER = SoupStrainer(id="calendar-event")
+IMFS_STRAINER = SoupStrainer(class_="page-content")
+LAWFIN_STRAINER = SoupStrainer("table", class_="event-list-table")
+LAWFIN_DETAIL_STRAINER = SoupStrainer(class_="event-detail")
 
 DETAIL_CACHE: Dict[str, Dict] = {}
 
+# The dashboard only shows the plain-text description; re-serialising the
+# description subtree to HTML is the slowest step of detail parsing, so
+# description_html is only filled when SEMINARS_KEEP_HTML=1.
+KEEP_HTML = os.environ.get("SEMINARS_KEEP_HTML") == "1"
+
+# Validators (ETag / Last-Modified / body hash) and parsed data of the wiwi
+# listing pages and of all detail pages from previous runs, so unchanged
+# pages are neither downloaded in full nor parsed again. Entries are tied to
+# a hash of this file (and KEEP_HTML), so any change to the parsing code
+# invalidates them.
+# Kept in LRU order and capped at HTTP_CACHE_MAX entries. Keys are
+# "listing:<url>" (data = list of rows) or "detail:<url>" (data = dict), since
+# a row's detail link can point back at its own listing page.
+HTTP_CACHE_PATH = ".http_cache.json"
+HTTP_CACHE_MAX = 500
+HTTP_CACHE: "OrderedDict[str, Dict]" = OrderedDict()
+_HTTP_CACHE_LOCK = threading.Lock()
+with open(__file__, "rb") as _f:
+    _SCRAPER_SHA = hashlib.sha256(_f.read() + (b"html" if KEEP_HTML else b"")).hexdigest()
+
+# Concurrent HTTP requests; the session's connection pool is sized to match
+MAX_WORKERS = 8
+
+# One shared session so requests to the same host (most pages live on
+# old.wiwi.uni-frankfurt.de) reuse keep-alive connections instead of doing a
+# fresh TCP+TLS handshake per page.
+SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=MAX_WORKERS,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
+SESSION.headers.update(
+    {
+        "User-Agent": "seminars-scraper/1.0",
+        # gzip/deflate plus br/zstd only when urllib3 can decode them
+        # (brotli / zstandard installed)
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Connection": "keep-alive",
+    }
+)
+atexit.register(SESSION.close)
+
 
 def resolve_url(page_url: str, href: str) -> str:
     if not href:
@@ -157,81 +242,165 @@ def resolve_url(page_url: str, href: str) -> str:
 
     return urljoin(page_url, href)
 
-DATE_CANDIDATE_PATTERNS = [
-    re.compile(r"\d{1,2}\.\s*[A-Za-zÄÖÜäöü]+\.?\s+\d{4}"),
-    re.compile(r"\d{1,2}\s+[A-Za-zÄÖÜäöü]+\.?\s+\d{4}"),
-    re.compile(r"\d{1,2}\.\d{1,2}\.\d{4}"),
-    re.compile(r"\d{4}-\d{2}-\d{2}"),
-]
+# One alternation (scanned once) instead of a search per format, ordered by
+# how often the format shows up: "02 July 2026", "27. November 2025",
+# "27.11.2025", "2025-11-04". The alternatives never match at the same
+# position, so the order only affects speed.
+_DATE_CANDIDATE = re.compile(
+    r"\d{1,2}\s+[A-Za-zÄÖÜäöü]+\.?\s+\d{4}"
+    r"|\d{1,2}\.\s*[A-Za-zÄÖÜäöü]+\.?\s+\d{4}"
+    r"|\d{1,2}\.\d{1,2}\.\d{4}"
+    r"|\d{4}-\d{2}-\d{2}"
+)
+
+_DATE_TRANS = str.maketrans({"\xa0": " ", "–": "-", "—": "-"})
+
+_RE_UHR = re.compile(r"\bUhr\b", re.IGNORECASE)
+_RE_TIME = re.compile(r"\d{1,2}:\d{2}")
+_RE_ISO_T = re.compile(r"^\d{4}-\d{2}-\d{2}T")
+# "04 Nov 2025" / "27. November 2025" (d1/mon1/y1) or "Nov 18, 2025" (mon2/d2/y2)
+_RE_NAMED = re.compile(
+    r"^(?:(?P<d1>\d{1,2})(?:\.\s*|\s+)(?P<mon1>[A-Za-zÄÖÜäöü\.]+)\s+(?P<y1>\d{4})"
+    r"|(?P<mon2>[A-Za-zÄÖÜäöü\.]+)\s+(?P<d2>\d{1,2}),\s*(?P<y2>\d{4}))$"
+)
+_RE_D_DOT_M_DOT_Y = re.compile(r"^(\d{1,2})\.(\d{1,2})\.(\d{4})$")
+
+# Field labels on the wiwi detail pages
+_LABEL_RES = {
+    label: re.compile(rf"^{re.escape(label)}\s*", re.IGNORECASE)
+    for label in ("When:", "Where:", "Speaker:")
+}
+
+# SVG icon titles ("location_pin", "speaker_icon") leaking into LawFin meta text
+_RE_ICON_LABEL = re.compile(r"^.*?(?:location|speaker)_\w+\s*")
+
+
+def _strip_weekday_prefix(s: str) -> str:
+    """Drop a leading weekday ("Wednesday ", "Wednesday, ", "Mi., ")."""
+    head = s[:_MAX_WEEKDAY_PREFIX].lower()
+    if not head.startswith(_SORTED_WEEKDAY_PREFIXES):
+        return s
+    for prefix in _SORTED_WEEKDAY_PREFIXES:
+        if not head.startswith(prefix):
+            continue
+        # The weekday must be followed by at least one space or comma
+        end = len(prefix)
+        while end < len(s) and (s[end] == "," or s[end].isspace()):
+            end += 1
+        if end > len(prefix):
+            return s[end:]
+    return s
 
 
+@lru_cache(maxsize=1024)
 def _extract_date_candidate(date_str: str) -> str:
-    for pattern in DATE_CANDIDATE_PATTERNS:
-        match = pattern.search(date_str)
-        if match:
-            return match.group(0)
-    return date_str
+    match = _DATE_CANDIDATE.search(date_str)
+    return match.group(0) if match else date_str
 
 
+def _named_month_date(day: str, month_token: str, year: str, date_str: str) -> date:
+    month_name = month_token.lower()
+    try:
+        month = MONTH_MAP[month_name]
+    except KeyError:
+        # Only odd tokens such as ".Nov" or "Nov.." end up here
+        month = MONTH_MAP.get(month_name.strip(".")) if "." in month_name else None
+        if not month:
+            raise ValueError(f"Unknown month: {month_name} in {date_str}") from None
+    return date(int(year), month, int(day))
+
+
+def _parse_iso(s: str) -> date:
+    return date(int(s[:4]), int(s[5:7]), int(s[8:]))
+
+
+def _parse_d_m_y(s: str) -> date:
+    day, month, year = s.split(".")
+    return date(int(year), int(month), int(day))
+
+
+def _parse_d_mon_y(s: str) -> date:
+    day, month_token, year = s.split()
+    return _named_month_date(day.rstrip("."), month_token, year, s)
+
+
+def _parse_mon_d_y(s: str) -> date:
+    month_token, day, year = s.split()
+    return _named_month_date(day.rstrip(","), month_token, year, s)
+
+
+# Layout signature of a date string: digits -> "9", letters -> "A", other
+# characters kept ("04 Nov. 2025" -> "99 AAA. 9999")
+_SHAPE_TRANS = str.maketrans(
+    "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyzÄÖÜäöü",
+    "9" * 10 + "A" * 58,
+)
+
+
+def _build_shape_parsers() -> Dict[str, Callable[[str], date]]:
+    parsers: Dict[str, Callable[[str], date]] = {"9999-99-99": _parse_iso}
+    for day in ("9", "99"):
+        for month in ("9", "99"):
+            parsers[f"{day}.{month}.9999"] = _parse_d_m_y
+    month_tokens = ["A" * n + dot for n in range(3, 10) for dot in ("", ".")]
+    for day in ("9", "99"):
+        for month in month_tokens:
+            parsers[f"{day} {month} 9999"] = _parse_d_mon_y
+            parsers[f"{day}. {month} 9999"] = _parse_d_mon_y
+            parsers[f"{month} {day}, 9999"] = _parse_mon_d_y
+    return parsers
+
+
+_SHAPE_PARSERS = _build_shape_parsers()
+
+
+@lru_cache(maxsize=2048)
 def parse_date(date_str: str) -> date:
-    """Handle all the weird date formats across the seminar pages."""
-    s = date_str.replace("\xa0", " ").replace("–", "-").replace("—", "-")
-    s = re.sub(r"\bUhr\b", "", s, flags=re.IGNORECASE)
+    """Handle all the weird date formats across the seminar pages.
+
+    Pure function of its input, so results are memoised; failures raise and
+    are not cached.
+    """
+    s = date_str.translate(_DATE_TRANS)
+
+    # Fast path: clean dates ("2025-11-04", "27.11.2025", "02 July 2026",
+    # "Nov 18, 2025", ...) are dispatched on their layout signature to a
+    # slicing parser without touching the regexes below
+    shape_parser = _SHAPE_PARSERS.get(s.translate(_SHAPE_TRANS))
+    if shape_parser is not None:
+        try:
+            return shape_parser(s)
+        except ValueError:
+            # Out-of-range values / unknown months: let the general parser
+            # report the error
+            pass
+
+    if "uhr" in s.lower():
+        s = _RE_UHR.sub("", s)
     s = s.strip()
-    s = WEEKDAY_PREFIX_RE.sub("", s).strip()
-    if "," in s and not re.search(r"\d{4}", s.split(",", 1)[0]):
-        # Remove leading weekday fragments like "Wednesday,"
-        head, tail = s.split(",", 1)
-        if WEEKDAY_PREFIX_RE.match(head.strip() + " "):
-            s = tail.strip()
+    s = _strip_weekday_prefix(s)
 
     # Pull out the actual date portion if the string also contains time info
     s = _extract_date_candidate(s)
 
     # Handle ISO date with optional time component (2025-11-04T12:30)
-    if re.match(r"^\d{4}-\d{2}-\d{2}T", s):
+    if _RE_ISO_T.match(s):
         s = s[:10]
 
-    # 04 Nov 2025
-    m = re.match(r"^(\d{1,2})\s+([A-Za-zÄÖÜäöü\.]+)\s+(\d{4})$", s)
-    if m:
-        day = int(m.group(1))
-        month_name = m.group(2).strip(".").lower()
-        year = int(m.group(3))
-        month = MONTH_MAP.get(month_name)
-        if not month:
-            raise ValueError(f"Unknown month: {month_name} in {date_str}")
-        return datetime(year, month, day).date()
-
-    # Nov 18, 2025
-    m = re.match(r"^([A-Za-zÄÖÜäöü\.]+)\s+(\d{1,2}),\s*(\d{4})$", s)
-    if m:
-        month_name = m.group(1).strip(".").lower()
-        day = int(m.group(2))
-        year = int(m.group(3))
-        month = MONTH_MAP.get(month_name)
-        if not month:
-            raise ValueError(f"Unknown month: {month_name} in {date_str}")
-        return datetime(year, month, day).date()
-
-    # 27. November 2025
-    m = re.match(r"^(\d{1,2})\.\s*([A-Za-zÄÖÜäöü\.]+)\s+(\d{4})$", s)
+    # 04 Nov 2025 / 27. November 2025 / Nov 18, 2025
+    m = _RE_NAMED.match(s)
     if m:
-        day = int(m.group(1))
-        month_name = m.group(2).strip(".").lower()
-        year = int(m.group(3))
-        month = MONTH_MAP.get(month_name)
-        if not month:
-            raise ValueError(f"Unknown month: {month_name} in {date_str}")
-        return datetime(year, month, day).date()
+        if m.group("d1"):
+            return _named_month_date(m.group("d1"), m.group("mon1"), m.group("y1"), date_str)
+        return _named_month_date(m.group("d2"), m.group("mon2"), m.group("y2"), date_str)
 
     # 27.11.2025
-    m = re.match(r"^(\d{1,2})\.(\d{1,2})\.(\d{4})$", s)
+    m = _RE_D_DOT_M_DOT_Y.match(s)
     if m:
         day = int(m.group(1))
         month = int(m.group(2))
         year = int(m.group(3))
-        return datetime(year, month, day).date()
+        return date(year, month, day)
 
     # Fallback to ISO-ish
     for fmt in ("%Y-%m-%d", "%d.%m.%Y"):
@@ -243,18 +412,115 @@ def parse_date(date_str: str) -> date:
     raise ValueError(f"Unrecognized date format: {date_str}")
 
 
-def fetch(url: str) -> BeautifulSoup:
-    resp = requests.get(url, timeout=30)
+def fetch_raw(url: str) -> bytes:
+    resp = SESSION.get(url, timeout=30)
     resp.raise_for_status()
-    return BeautifulSoup(resp.text, "html.parser")
+    return resp.content
+
+
+def fetch_conditional(url: str, key: str) -> Tuple[Optional[bytes], Dict]:
+    """Conditional GET against the validators stored in HTTP_CACHE[key].
+
+    Returns ``(None, entry)`` if the page is unchanged since the cached entry
+    (HTTP 304 or identical body), otherwise ``(content, validators)``.
+    """
+    entry = HTTP_CACHE.get(key)
+    headers: Dict[str, str] = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = SESSION.get(url, timeout=30, headers=headers)
+    if entry and resp.status_code == 304:
+        return None, entry
+    resp.raise_for_status()
+
+    validators = {
+        "etag": resp.headers.get("ETag", ""),
+        "last_modified": resp.headers.get("Last-Modified", ""),
+        "body_sha": hashlib.sha256(resp.content).hexdigest(),
+    }
+    if entry and entry.get("body_sha") == validators["body_sha"]:
+        # Server ignored the validators (or sent none) but nothing changed
+        return None, {**entry, **validators}
+    return resp.content, validators
+
+
+def load_http_cache() -> None:
+    try:
+        with open(HTTP_CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return
+    if cache.get("scraper") == _SCRAPER_SHA:
+        HTTP_CACHE.update(cache.get("entries", {}))
+
+
+def store_http_cache(key: str, entry: Dict) -> None:
+    with _HTTP_CACHE_LOCK:
+        HTTP_CACHE[key] = entry
+        HTTP_CACHE.move_to_end(key)
+        while len(HTTP_CACHE) > HTTP_CACHE_MAX:
+            HTTP_CACHE.popitem(last=False)
+
+
+def save_http_cache() -> None:
+    with open(HTTP_CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump({"scraper": _SCRAPER_SHA, "entries": HTTP_CACHE}, f, ensure_ascii=False)
+
+
+def cached_detail(url: str, parse: Callable[[str, bytes], Dict]) -> Dict:
+    """Fetch and parse a detail page once per run, reusing previous runs' data.
+
+    Pages that cannot be fetched yield an empty dict.
+    """
+    if not url:
+        return {}
+    cached = DETAIL_CACHE.get(url)
+    if cached is not None:
+        return cached
+
+    key = "detail:" + url
+    with _HTTP_CACHE_LOCK:
+        # Never hand back anything but parsed detail data, and make sure a
+        # 304 cannot be answered from an entry without it
+        if not isinstance(HTTP_CACHE.get(key, {}).get("data", {}), dict):
+            del HTTP_CACHE[key]
+
+    try:
+        content, entry = fetch_conditional(url, key)
+    except Exception:
+        DETAIL_CACHE[url] = {}
+        return {}
+
+    if content is None:
+        result = entry["data"]
+    else:
+        result = parse(url, content)
+        entry = {**entry, "data": result}
+    store_http_cache(key, entry)
+    DETAIL_CACHE[url] = result
+    return result
+
+
+def parse_html(content: bytes, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    # Hand over the raw bytes so the parser sniffs the encoding itself
+    return BeautifulSoup(content, HTML_PARSER, parse_only=parse_only)
+
+
+def fetch(url: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    return parse_html(fetch_raw(url), parse_only)
 
 
 def _clean_label_value(text: str, label: str) -> str:
     if not text:
         return ""
     text = text.replace("\xa0", " ").strip()
-    if label:
-        text = re.sub(rf"^{re.escape(label)}\s*", "", text, flags=re.IGNORECASE)
+    if label and text[: len(label)].lower() == label.lower():
+        pattern = _LABEL_RES.get(label) or re.compile(rf"^{re.escape(label)}\s*", re.IGNORECASE)
+        text = pattern.sub("", text)
     return text.strip()
 
 
@@ -262,38 +528,60 @@ def _extract_time_fragment(text: str) -> str:
     if not text:
         return ""
     text = text.replace("\xa0", " ")
-    m = re.findall(r"\d{1,2}:\d{2}", text)
+    m = _RE_TIME.search(text)
     if m:
-        return m[0]
+        return m.group(0)
     return text.strip(" ,\u2013-")
 
 
+def _first_by_class(container: Tag, wanted: Dict[str, Optional[str]]) -> Dict[str, Tag]:
+    """Find the first descendant carrying each CSS class in a single walk.
+
+    ``wanted`` maps class -> required tag name (or None for any tag); the
+    walk stops as soon as every class has been found.
+    """
+    found: Dict[str, Tag] = {}
+    for tag in container.descendants:
+        if not isinstance(tag, Tag):
+            continue
+        for css_class in tag.get("class") or ():
+            if css_class in wanted and css_class not in found and wanted[css_class] in (None, tag.name):
+                found[css_class] = tag
+        if len(found) == len(wanted):
+            break
+    return found
+
+
+_WIWI_DETAIL_FIELDS: Dict[str, Optional[str]] = {
+    "title": "h1",
+    "startdate": None,
+    "starttime": None,
+    "endtime": None,
+    "location": None,
+    "organizer": None,
+    "description": None,
+}
+
+
 def scrape_wiwi_details(url: str) -> Dict:
-    if not url:
-        return {}
-    cached = DETAIL_CACHE.get(url)
-    if cached is not None:
-        return cached
+    return cached_detail(url, parse_wiwi_details)
 
-    result: Dict[str, str] = {}
-    try:
-        soup = fetch(url)
-    except Exception:
-        DETAIL_CACHE[url] = {}
-        return {}
 
-    container = soup.select_one("#calendar-event")
+def parse_wiwi_details(url: str, content: bytes) -> Dict:
+    result: Dict[str, str] = {}
+    soup = parse_html(content, parse_only=WIWI_DETAIL_STRAINER)
+    container = soup.find(id="calendar-event")
     if not container:
-        DETAIL_CACHE[url] = {}
         return {}
+    fields = _first_by_class(container, _WIWI_DETAIL_FIELDS)
 
-    title_tag = container.select_one("h1.title")
+    title_tag = fields.get("title")
     if title_tag:
         title_text = title_tag.get_text(" ", strip=True)
         if title_text:
             result["title"] = title_text
 
-    startdate_div = container.select_one(".startdate")
+    startdate_div = fields.get("startdate")
     if startdate_div:
         raw_date_text = _clean_label_value(startdate_div.get_text(" ", strip=True), "When:")
         if raw_date_text:
@@ -304,8 +592,8 @@ def scrape_wiwi_details(url: str) -> Dict:
             except Exception:
                 pass
 
-    starttime_div = container.select_one(".starttime")
-    endtime_div = container.select_one(".endtime")
+    starttime_div = fields.get("starttime")
+    endtime_div = fields.get("endtime")
     start_time = _extract_time_fragment(starttime_div.get_text(" ", strip=True)) if starttime_div else ""
     end_time = _extract_time_fragment(endtime_div.get_text(" ", strip=True)) if endtime_div else ""
     if start_time:
@@ -317,13 +605,13 @@ def scrape_wiwi_details(url: str) -> Dict:
     elif start_time:
         result["time_info"] = start_time
 
-    location_div = container.select_one(".location")
+    location_div = fields.get("location")
     if location_div:
         location_text = _clean_label_value(location_div.get_text(" ", strip=True), "Where:")
         if location_text:
             result["location"] = location_text
 
-    organizer_div = container.select_one(".organizer")
+    organizer_div = fields.get("organizer")
     if organizer_div:
         organizer_text = _clean_label_value(organizer_div.get_text(" ", strip=True), "Speaker:")
         if organizer_text:
@@ -332,36 +620,47 @@ def scrape_wiwi_details(url: str) -> Dict:
         if link:
             result["speaker_url"] = resolve_url(url, link["href"])
 
-    description_div = container.select_one(".description")
+    description_div = fields.get("description")
     if description_div:
         description_text = description_div.get_text("\n", strip=True)
         if description_text:
             result["description"] = description_text
-        html = description_div.decode_contents().strip()
-        if html:
-            result["description_html"] = html
+        if KEEP_HTML:
+            html = description_div.decode_contents().strip()
+            if html:
+                result["description_html"] = html
 
-    DETAIL_CACHE[url] = result
     return result
 
 
-def scrape_wiwi_table(cfg: Dict) -> List[Dict]:
-    """Generic scraper for all old.wiwi.uni-frankfurt.de seminar tables."""
+def parse_wiwi_rows(cfg: Dict, content: bytes) -> List[Dict]:
+    """Extract the raw rows of a wiwi seminar table from the listing HTML.
+
+    Pure CPU work on plain bytes/dicts, so it can run in a worker process.
+    """
     url = cfg["page"]
-    soup = fetch(url)
-    table = soup.select_one("table.data-table-event")
-    events: List[Dict] = []
+    soup = parse_html(content, parse_only=WIWI_STRAINER)
+    # Native find()/find_all() instead of CSS selectors: avoids compiling and
+    # matching selectors in soupsieve for every page
+    table = soup.find("table", class_="data-table-event")
+    rows: List[Dict] = []
 
     if not table:
-        return events
+        return rows
 
-    for tr in table.select("tbody tr"):
-        tds = tr.find_all("td")
+    trs = [tr for tr in table.find_all("tr") if tr.find_parent("tbody")]
+    for tr in trs:
+        # Walk the row once and index the cells by CSS class
+        tds = [child for child in tr.children if getattr(child, "name", None) == "td"]
         if not tds:
             continue
+        td_by_class: Dict[str, Tag] = {}
+        for td in tds:
+            for css_class in td.get("class") or ():
+                td_by_class.setdefault(css_class, td)
 
         # Date
-        date_td = tr.find("td", class_="dtstart-container") or tds[0]
+        date_td = td_by_class.get("dtstart-container") or tds[0]
         date_text = date_td.get_text(strip=True)
         if not date_text:
             continue
@@ -373,7 +672,7 @@ def scrape_wiwi_table(cfg: Dict) -> List[Dict]:
             continue
 
         # Speaker
-        speaker_td = tr.find("td", class_="speaker") or (tds[1] if len(tds) > 1 else None)
+        speaker_td = td_by_class.get("speaker") or (tds[1] if len(tds) > 1 else None)
         speaker = speaker_td.get_text(" ", strip=True) if speaker_td else ""
         speaker_url = ""
         if speaker_td:
@@ -382,7 +681,7 @@ def scrape_wiwi_table(cfg: Dict) -> List[Dict]:
                 speaker_url = resolve_url(url, link["href"])
 
         # Title + details link
-        summary_td = tr.find("td", class_="summary") or (tds[2] if len(tds) > 2 else None)
+        summary_td = td_by_class.get("summary") or (tds[2] if len(tds) > 2 else None)
         title = ""
         details_url = ""
         if summary_td:
@@ -399,51 +698,75 @@ def scrape_wiwi_table(cfg: Dict) -> List[Dict]:
             # Typically "Keine Ereignisse gefunden."
             continue
 
-        detail_data = scrape_wiwi_details(details_url) if details_url else {}
-
-        event_time_info = detail_data.get("time_info") or cfg.get("time_info", "")
-        event_location = detail_data.get("location") or cfg.get("location", "")
-        event_date = detail_data.get("date", d.isoformat())
-        event_raw_date = detail_data.get("raw_date", date_text)
-        event_title = detail_data.get("title", title)
-        event_speaker = detail_data.get("speaker", speaker)
-        event_speaker_url = detail_data.get("speaker_url", speaker_url)
-
-        events.append(
+        rows.append(
             {
-                "seminar_id": cfg["id"],
-                "seminar_name": cfg["name"],
-                "seminar_page": cfg["page"],   # <- used by "Open seminar page" button
-                "title": event_title,
-                "speaker": event_speaker,
-                "speaker_url": event_speaker_url,
-                "date": event_date,
-                "raw_date": event_raw_date,
-                "time_info": event_time_info,
-                "start_time": detail_data.get("start_time", ""),
-                "end_time": detail_data.get("end_time", ""),
-                "location": event_location,
-                "description": detail_data.get("description", ""),
-                "description_html": detail_data.get("description_html", ""),
-                "details_url": details_url or cfg["page"],
-                "source": "Goethe University Frankfurt",
+                "date": d.isoformat(),
+                "raw_date": date_text,
+                "title": title,
+                "speaker": speaker,
+                "speaker_url": speaker_url,
+                "details_url": details_url,
             }
         )
 
-    return events
-
-
-def scrape_imfs() -> List[Dict]:
+    return rows
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """One seminar talk as written to events.json (field order = JSON key order)."""
+
+    seminar_id: str
+    seminar_name: str
+    seminar_page: str
+    title: str
+    speaker: str
+    speaker_url: str = ""
+    date: str = ""
+    raw_date: str = ""
+    time_info: str = ""
+    start_time: str = ""
+    end_time: str = ""
+    location: str = ""
+    description: str = ""
+    description_html: str = ""
+    details_url: str = ""
+    source: str = ""
+
+
+def build_wiwi_event(cfg: Dict, row: Dict, detail_data: Dict) -> Event:
+    """Merge a listing row with its (possibly empty) detail page data."""
+    return Event(
+        seminar_id=cfg["id"],
+        seminar_name=cfg["name"],
+        seminar_page=cfg["page"],   # <- used by "Open seminar page" button
+        title=detail_data.get("title", row["title"]),
+        speaker=detail_data.get("speaker", row["speaker"]),
+        speaker_url=detail_data.get("speaker_url", row["speaker_url"]),
+        date=detail_data.get("date", row["date"]),
+        raw_date=detail_data.get("raw_date", row["raw_date"]),
+        time_info=detail_data.get("time_info") or cfg.get("time_info", ""),
+        start_time=detail_data.get("start_time", ""),
+        end_time=detail_data.get("end_time", ""),
+        location=detail_data.get("location") or cfg.get("location", ""),
+        description=detail_data.get("description", ""),
+        description_html=detail_data.get("description_html", ""),
+        details_url=row["details_url"] or cfg["page"],
+        source="Goethe University Frankfurt",
+    )
+
+
+def scrape_imfs() -> List[Event]:
     """Parse IMFS upcoming events page into structured events."""
 
-    soup = fetch(IMFS_URL)
-    content = soup.select_one(".page-content")
+    soup = fetch(IMFS_URL, parse_only=IMFS_STRAINER)
+    content = soup.find(class_="page-content")
     if not content:
         return []
 
-    events: List[Dict] = []
+    events: List[Event] = []
 
-    for frame in content.select("div.frame-type-text"):
+    for frame in content.find_all("div", class_="frame-type-text"):
         heading = frame.find("h2")
         if not heading:
             continue
@@ -458,40 +781,38 @@ def scrape_imfs() -> List[Dict]:
 
         first_paragraph = paragraphs[0]
 
+        # One pass over the paragraph: the speaker is the text before the
+        # first <br>/<i>; without an <i> title, the title is the first text
+        # after the first <br>
+        title_tag = first_paragraph.find("i")
         speaker_parts: List[str] = []
+        in_speaker = True
+        seen_break = False
+        text_after_break = ""
         for child in first_paragraph.children:
-            if isinstance(child, Tag) and child.name.lower() in {"br", "i"}:
-                break
-            if isinstance(child, NavigableString):
-                text = child.strip()
-            else:
-                text = child.get_text(" ", strip=True)
-            if text:
+            name = child.name.lower() if isinstance(child, Tag) else None
+            if name == "br":
+                in_speaker = False
+                seen_break = True
+                continue
+            if name == "i":
+                in_speaker = False
+            if not in_speaker and (title_tag or not seen_break or text_after_break):
+                continue
+            text = child.strip() if name is None else child.get_text(" ", strip=True)
+            if not text:
+                continue
+            if in_speaker:
                 speaker_parts.append(text.strip(" ,"))
+            else:
+                text_after_break = text
 
-        speaker = re.sub(r"\s+", " ", " ".join(speaker_parts)).strip(" ,") if speaker_parts else ""
+        speaker = " ".join(" ".join(speaker_parts).split()).strip(" ,") if speaker_parts else ""
 
-        title = ""
-        title_tag = first_paragraph.find("i")
         if title_tag:
             title = title_tag.get_text(" ", strip=True).strip('"“”')
         else:
-            after_break: List[str] = []
-            seen_break = False
-            for child in first_paragraph.children:
-                if isinstance(child, Tag) and child.name.lower() == "br":
-                    seen_break = True
-                    continue
-                if not seen_break:
-                    continue
-                if isinstance(child, NavigableString):
-                    text = child.strip()
-                else:
-                    text = child.get_text(" ", strip=True)
-                if text:
-                    after_break.append(text)
-            if after_break:
-                title = after_break[0].strip('"“”')
+            title = text_after_break.strip('"“”')
 
         second_paragraph = paragraphs[1] if len(paragraphs) > 1 else None
 
@@ -512,7 +833,7 @@ def scrape_imfs() -> List[Dict]:
                     date_iso = ""
 
                 if len(strongs) > 1:
-                    time_info = re.sub(r"\bUhr\b", "", strongs[1].get_text(" ", strip=True), flags=re.IGNORECASE).strip()
+                    time_info = _RE_UHR.sub("", strongs[1].get_text(" ", strip=True)).strip()
 
                 for st in strongs:
                     st.extract()
@@ -547,49 +868,50 @@ def scrape_imfs() -> List[Dict]:
                 details_url = urljoin(IMFS_URL, href)
 
         events.append(
-            {
-                "seminar_id": "imfs",
-                "seminar_name": seminar_display,
-                "seminar_page": IMFS_URL,
-                "title": title,
-                "speaker": speaker,
-                "date": date_iso,
-                "raw_date": raw_date,
-                "time_info": time_info,
-                "location": location,
-                "details_url": details_url,
-                "source": "IMFS Frankfurt",
-            }
+            Event(
+                seminar_id="imfs",
+                seminar_name=seminar_display,
+                seminar_page=IMFS_URL,
+                title=title,
+                speaker=speaker,
+                date=date_iso,
+                raw_date=raw_date,
+                time_info=time_info,
+                location=location,
+                details_url=details_url,
+                source="IMFS Frankfurt",
+            )
         )
 
     return events
 
 
+_LAWFIN_DETAIL_FIELDS: Dict[str, Optional[str]] = {
+    "event-detail-meta-date": None,
+    "event-detail-meta-location": None,
+    "event-detail-meta-speaker": None,
+    "event-detail-description": None,
+}
+
+
 def scrape_lawfin_details(url: str) -> Dict:
     """Fetch a LawFin detail page and extract time, location, description."""
-    if not url:
-        return {}
-    cached = DETAIL_CACHE.get(url)
-    if cached is not None:
-        return cached
+    return cached_detail(url, parse_lawfin_details)
 
-    result: Dict[str, str] = {}
-    try:
-        soup = fetch(url)
-    except Exception:
-        DETAIL_CACHE[url] = {}
-        return {}
 
-    detail = soup.select_one(".event-detail")
+def parse_lawfin_details(url: str, content: bytes) -> Dict:
+    result: Dict[str, str] = {}
+    soup = parse_html(content, parse_only=LAWFIN_DETAIL_STRAINER)
+    detail = soup.find(class_="event-detail")
     if not detail:
-        DETAIL_CACHE[url] = {}
         return {}
+    fields = _first_by_class(detail, _LAWFIN_DETAIL_FIELDS)
 
     # Time from .event-detail-meta-date  ("... 14:15 ... - ... 15:30")
-    date_div = detail.select_one(".event-detail-meta-date")
+    date_div = fields.get("event-detail-meta-date")
     if date_div:
         raw = date_div.get_text(" ", strip=True)
-        times = re.findall(r"\d{1,2}:\d{2}", raw)
+        times = _RE_TIME.findall(raw)
         if len(times) >= 2:
             result["start_time"] = times[0]
             result["end_time"] = times[1]
@@ -599,46 +921,47 @@ def scrape_lawfin_details(url: str) -> Dict:
             result["time_info"] = times[0]
 
     # Location from .event-detail-meta-location
-    loc_div = detail.select_one(".event-detail-meta-location")
+    loc_div = fields.get("event-detail-meta-location")
     if loc_div:
         loc_text = loc_div.get_text(" ", strip=True)
         # Strip the SVG title text that leaks into get_text
-        loc_text = re.sub(r"^.*?location_\w+\s*", "", loc_text).strip()
+        loc_text = _RE_ICON_LABEL.sub("", loc_text).strip()
         if loc_text:
             result["location"] = loc_text
 
     # Speaker from .event-detail-meta-speaker
-    speaker_div = detail.select_one(".event-detail-meta-speaker")
+    speaker_div = fields.get("event-detail-meta-speaker")
     if speaker_div:
         sp_text = speaker_div.get_text(" ", strip=True)
-        sp_text = re.sub(r"^.*?speaker_\w+\s*", "", sp_text).strip()
+        sp_text = _RE_ICON_LABEL.sub("", sp_text).strip()
         if sp_text:
             result["speaker"] = sp_text
 
     # Description
-    desc_div = detail.select_one(".event-detail-description")
+    desc_div = fields.get("event-detail-description")
     if desc_div:
         description_text = desc_div.get_text("\n", strip=True)
         if description_text:
             result["description"] = description_text
-        html = desc_div.decode_contents().strip()
-        if html:
-            result["description_html"] = html
+        if KEEP_HTML:
+            html = desc_div.decode_contents().strip()
+            if html:
+                result["description_html"] = html
 
-    DETAIL_CACHE[url] = result
     return result
 
 
-def scrape_lawfin() -> List[Dict]:
+def scrape_lawfin() -> List[Event]:
     """Parse LawFin Research Seminars page."""
-    soup = fetch(LAWFIN_URL)
-    table = soup.select_one("table.event-list-table")
-    events: List[Dict] = []
+    soup = fetch(LAWFIN_URL, parse_only=LAWFIN_STRAINER)
+    table = soup.find("table", class_="event-list-table")
+    events: List[Event] = []
 
     if not table:
         return events
 
-    for tr in table.select("tbody tr"):
+    trs = [tr for tr in table.find_all("tr") if tr.find_parent("tbody")]
+    for tr in trs:
         tds = tr.find_all("td")
         if len(tds) < 3:
             continue
@@ -676,57 +999,108 @@ def scrape_lawfin() -> List[Dict]:
         detail_data = scrape_lawfin_details(details_url) if details_url else {}
 
         events.append(
-            {
-                "seminar_id": "lawfin",
-                "seminar_name": "LawFin Research Seminar",
-                "seminar_page": LAWFIN_URL,
-                "title": title,
-                "speaker": detail_data.get("speaker", speaker),
-                "speaker_url": speaker_url,
-                "date": d.isoformat(),
-                "raw_date": date_text,
-                "time_info": detail_data.get("time_info", ""),
-                "start_time": detail_data.get("start_time", ""),
-                "end_time": detail_data.get("end_time", ""),
-                "location": detail_data.get("location", ""),
-                "description": detail_data.get("description", ""),
-                "description_html": detail_data.get("description_html", ""),
-                "details_url": details_url or LAWFIN_URL,
-                "source": "LawFin Goethe University Frankfurt",
-            }
+            Event(
+                seminar_id="lawfin",
+                seminar_name="LawFin Research Seminar",
+                seminar_page=LAWFIN_URL,
+                title=title,
+                speaker=detail_data.get("speaker", speaker),
+                speaker_url=speaker_url,
+                date=d.isoformat(),
+                raw_date=date_text,
+                time_info=detail_data.get("time_info", ""),
+                start_time=detail_data.get("start_time", ""),
+                end_time=detail_data.get("end_time", ""),
+                location=detail_data.get("location", ""),
+                description=detail_data.get("description", ""),
+                description_html=detail_data.get("description_html", ""),
+                details_url=details_url or LAWFIN_URL,
+                source="LawFin Goethe University Frankfurt",
+            )
         )
 
     return events
 
 
-def main() -> None:
-    all_events: List[Dict] = []
-
-    # Wiwi seminar tables
-    for cfg in SEMINARS:
-        all_events.extend(scrape_wiwi_table(cfg))
-
-    # IMFS
-    all_events.extend(scrape_imfs())
+def write_events(events: List[Event], path: str) -> None:
+    """Write events as indented UTF-8 JSON (same bytes with or without orjson)."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(events, option=option))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(events, f, indent=2, ensure_ascii=False, default=asdict)
+        f.write("\n")
 
-    # LawFin
-    all_events.extend(scrape_lawfin())
 
-    # De-duplicate (same seminar + title + date)
-    seen = set()
-    unique_events: List[Dict] = []
+def main() -> None:
+    all_events: List[Event] = []
+    load_http_cache()
+
+    # Downloading is network-bound, so the wiwi listing pages are fetched
+    # concurrently together with the IMFS and LawFin scrapers. Results are
+    # always collected in submission order to keep events.json stable.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        listing_futures = [
+            ex.submit(fetch_conditional, cfg["page"], "listing:" + cfg["page"])
+            for cfg in SEMINARS
+        ]
+        imfs_future = ex.submit(scrape_imfs)
+        lawfin_future = ex.submit(scrape_lawfin)
+        listings = [future.result() for future in listing_futures]
+        imfs_events = imfs_future.result()
+        lawfin_events = lawfin_future.result()
+
+    # Unchanged listing pages reuse the rows parsed on a previous run
+    wiwi_rows: List[List[Dict]] = []
+    changed: List[int] = []
+    for i, (cfg, (content, entry)) in enumerate(zip(SEMINARS, listings)):
+        if content is None:
+            store_http_cache("listing:" + cfg["page"], entry)
+            wiwi_rows.append(entry["data"])
+        else:
+            changed.append(i)
+            wiwi_rows.append([])
+
+    # Parsing the wiwi tables is CPU-bound; run it in worker processes (only
+    # plain dicts and bytes cross the process boundary).
+    if changed:
+        with ProcessPoolExecutor(max_workers=min(len(changed), os.cpu_count() or 1)) as pp:
+            parsed = pp.map(
+                parse_wiwi_rows,
+                [SEMINARS[i] for i in changed],
+                [listings[i][0] for i in changed],
+            )
+            for i, rows in zip(changed, parsed):
+                wiwi_rows[i] = rows
+                store_http_cache("listing:" + SEMINARS[i]["page"], {**listings[i][1], "data": rows})
+
+    # Detail pages are network-bound again. Collect the distinct detail URLs
+    # of all seminars first (the same event is often linked from several
+    # tables) and fetch them in one batch
+    wiwi_jobs = [(cfg, row) for cfg, rows in zip(SEMINARS, wiwi_rows) for row in rows]
+    detail_urls = list(dict.fromkeys(row["details_url"] for _, row in wiwi_jobs if row["details_url"]))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        details = dict(zip(detail_urls, ex.map(scrape_wiwi_details, detail_urls)))
+    for cfg, row in wiwi_jobs:
+        all_events.append(build_wiwi_event(cfg, row, details.get(row["details_url"], {})))
+
+    all_events.extend(imfs_events)
+    all_events.extend(lawfin_events)
+
+    # De-duplicate (same seminar + title + date); the first occurrence wins
+    # and the dict keeps insertion order
+    unique: Dict[Tuple[str, str, str], Event] = {}
     for ev in all_events:
-        key = (ev["seminar_id"], ev["title"], ev["date"])
-        if key in seen:
-            continue
-        seen.add(key)
-        unique_events.append(ev)
+        unique.setdefault((ev.seminar_id, ev.title, ev.date), ev)
 
     # Sort by date (string ISO "YYYY-MM-DD" works lexicographically)
-    unique_events.sort(key=lambda e: e["date"])
+    unique_events = sorted(unique.values(), key=attrgetter("date"))
+
+    write_events(unique_events, "events.json")
 
-    with open("events.json", "w", encoding="utf-8") as f:
-        json.dump(unique_events, f, indent=2, ensure_ascii=False)
+    save_http_cache()
 
 
 if __name__ == "__main__":